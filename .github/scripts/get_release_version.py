@@ -1,21 +1,21 @@
 import os
-import sys
+from pathlib import Path
 
-gitRef = os.getenv("GITHUB_REF")
+git_ref = os.getenv("GITHUB_REF")
 
-with open(os.getenv("GITHUB_ENV"), "a") as githubEnv:
-    with open("version.txt") as f:
-        version = f.read()
-    releaseVersion = version.strip()
-    releaseNotePath = "docs/release_notes/v{}.md".format(releaseVersion)
+version = Path("version.txt").read_text().strip()
+release_note_path = Path(f"docs/release_notes/v{version}.md")
 
-    print("Checking if {} exists".format(releaseNotePath))
-    if os.path.exists(releaseNotePath):
-        print("Found {}".format(releaseNotePath))
-        # Set LATEST_RELEASE to true
-        githubEnv.write("LATEST_RELEASE=true\n")
-    else:
-        print("{} is not found".format(releaseNotePath))
-    print("Release build from {}...".format(gitRef))
+env_lines = [f"REL_VERSION={version}\n"]
 
-    githubEnv.write("REL_VERSION={}\n".format(releaseVersion))
+print(f"Checking if {release_note_path} exists")
+if release_note_path.exists():
+    print(f"Found {release_note_path}")
+    # Set LATEST_RELEASE to true
+    env_lines.append("LATEST_RELEASE=true\n")
+else:
+    print(f"{release_note_path} is not found")
+print(f"Release build from {git_ref}...")
+
+with open(os.environ["GITHUB_ENV"], "a") as github_env:
+    github_env.write("".join(env_lines))
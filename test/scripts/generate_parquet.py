@@ -0,0 +1,46 @@
+# Generates datatypes.parquet, a one-row fixture covering the data types the
+# runtime needs to round-trip from Parquet.
+#
+# The table is built directly as Arrow arrays with an explicit schema, so the
+# fixture's types are deterministic instead of depending on pandas dtype
+# inference.
+
+from datetime import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+SCHEMA = pa.schema(
+    [
+        ("integer", pa.int64()),
+        ("text", pa.string()),
+        ("boolean", pa.bool_()),
+        ("float", pa.float64()),
+        ("timestamp", pa.timestamp("ns")),
+        ("date", pa.date32()),
+        ("time", pa.time64("us")),
+        ("list", pa.list_(pa.int64())),
+        # Parquet has no set type, so sets are stored as sorted lists.
+        ("set", pa.list_(pa.int64())),
+        ("dict", pa.map_(pa.string(), pa.int64())),
+    ]
+)
+
+table = pa.Table.from_pydict(
+    {
+        "integer": [1],
+        "text": ["text"],
+        "boolean": [True],
+        "float": [1.1],
+        "timestamp": [np.datetime64("2021-01-01T00:00:00", "ns")],
+        "date": np.array(["2021-01-01"], dtype="datetime64[D]"),
+        "time": [time(0, 0, 0)],
+        "list": [[1, 2, 3]],
+        "set": [sorted({1, 2, 3})],
+        "dict": [{"a": 1, "b": 2}],
+    },
+    schema=SCHEMA,
+)
+
+pq.write_table(table, "datatypes.parquet")
@@ -0,0 +1,310 @@
+# Converts pipe-delimited TPC-H table files (as emitted by dbgen) into Parquet.
+#
+# Decimal columns are parsed directly into Arrow decimal128 values by the
+# Arrow CSV reader's C++ kernels, so no per-row Python Decimal objects are
+# ever created.
+
+import argparse
+import functools
+import os
+from concurrent import futures
+from types import MappingProxyType
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import csv
+
+COLUMN_DEFINITIONS = {
+    "region": {
+        "r_regionkey": "int8",
+        "r_name": "string",
+        "r_comment": "string",
+    },
+    "nation": {
+        "n_nationkey": "int8",
+        "n_name": "string",
+        "n_regionkey": "int8",
+        "n_comment": "string",
+    },
+    "supplier": {
+        "s_suppkey": "int64",
+        "s_name": "string",
+        "s_address": "string",
+        "s_nationkey": "int8",
+        "s_phone": "string",
+        "s_acctbal": ("decimal", 12, 2),
+        "s_comment": "string",
+    },
+    "customer": {
+        "c_custkey": "int64",
+        "c_name": "string",
+        "c_address": "string",
+        "c_nationkey": "int8",
+        "c_phone": "string",
+        "c_acctbal": ("decimal", 12, 2),
+        "c_mktsegment": "string",
+        "c_comment": "string",
+    },
+    "part": {
+        "p_partkey": "int64",
+        "p_name": "string",
+        "p_mfgr": "string",
+        "p_brand": "string",
+        "p_type": "string",
+        "p_size": "int16",
+        "p_container": "string",
+        "p_retailprice": ("decimal", 12, 2),
+        "p_comment": "string",
+    },
+    "partsupp": {
+        "ps_partkey": "int64",
+        "ps_suppkey": "int64",
+        "ps_availqty": "int32",
+        "ps_supplycost": ("decimal", 12, 2),
+        "ps_comment": "string",
+    },
+    "orders": {
+        "o_orderkey": "int64",
+        "o_custkey": "int64",
+        "o_orderstatus": "string",
+        "o_totalprice": ("decimal", 12, 2),
+        "o_orderdate": "date",
+        "o_orderpriority": "string",
+        "o_clerk": "string",
+        "o_shippriority": "int8",
+        "o_comment": "string",
+    },
+    "lineitem": {
+        "l_orderkey": "int64",
+        "l_partkey": "int64",
+        "l_suppkey": "int64",
+        "l_linenumber": "int16",
+        "l_quantity": ("decimal", 12, 2),
+        "l_extendedprice": ("decimal", 12, 2),
+        "l_discount": ("decimal", 4, 2),
+        "l_tax": ("decimal", 4, 2),
+        "l_returnflag": "string",
+        "l_linestatus": "string",
+        "l_shipdate": "date",
+        "l_commitdate": "date",
+        "l_receiptdate": "date",
+        "l_shipinstruct": "string",
+        "l_shipmode": "string",
+        "l_comment": "string",
+    },
+}
+
+
+def arrow_type(dtype):
+    # Decimal columns carry their TPC-H precision and scale as a
+    # ("decimal", precision, scale) tuple.
+    if isinstance(dtype, tuple):
+        _, precision, scale = dtype
+        return pa.decimal128(precision, scale)
+    if dtype == "int8":
+        return pa.int8()
+    if dtype == "int16":
+        return pa.int16()
+    if dtype == "int32":
+        return pa.int32()
+    if dtype == "int64":
+        return pa.int64()
+    if dtype == "string":
+        return pa.string()
+    if dtype == "date":
+        return pa.date32()
+    raise ValueError(f"unknown column dtype: {dtype}")
+
+
+# CSV decode block size, which also bounds the size of each Parquet row group.
+BLOCK_SIZE = 64 << 20
+
+# String columns with a handful of distinct values per the TPC-H spec. Only
+# these get Parquet dictionary encoding: they collapse to one dictionary page
+# plus RLE-packed indices, while the high-cardinality comment/address columns
+# would just build a large dictionary and fall back to plain anyway.
+LOW_CARDINALITY_COLUMNS = {
+    "customer": ["c_mktsegment"],
+    "part": ["p_mfgr", "p_brand", "p_container"],
+    "orders": ["o_orderstatus", "o_orderpriority"],
+    "lineitem": ["l_returnflag", "l_linestatus", "l_shipinstruct", "l_shipmode"],
+}
+
+# The two big tables are written as Hive-partitioned datasets keyed on the
+# year of these date columns, so readers filtering on a date range (TPC-H Q1,
+# Q6, ...) can skip whole files instead of just row groups. The small tables
+# stay single-file.
+PARTITION_DATE_COLUMNS = {
+    "lineitem": "l_shipdate",
+    "orders": "o_orderdate",
+}
+
+# Rows per Parquet row group. The wide tables get smaller groups so chunked
+# readers can overlap I/O with decode instead of holding 100MB+ compressed
+# groups; narrow tables keep the 1M-row default.
+DEFAULT_ROW_GROUP_SIZE = 1 << 20
+ROW_GROUP_SIZE = {
+    "lineitem": 128 << 10,
+    "orders": 256 << 10,
+}
+
+# Built once at import so repeated csv_to_parquet calls (or the process pool
+# workers looping over tables) don't reconstruct schemas and options per call.
+# MappingProxyType keeps them read-only.
+_ARROW_SCHEMAS = MappingProxyType(
+    {
+        name: pa.schema([(col, arrow_type(dtype)) for col, dtype in columns.items()])
+        for name, columns in COLUMN_DEFINITIONS.items()
+    }
+)
+
+_CONVERT_OPTS = MappingProxyType(
+    {
+        name: csv.ConvertOptions(
+            column_types={col: arrow_type(dtype) for col, dtype in columns.items()}
+        )
+        for name, columns in COLUMN_DEFINITIONS.items()
+    }
+)
+
+
+def _csv_to_parquet_polars(csv_file, parquet_file, table_name, compression, row_group_size):
+    import polars as pl
+
+    polars_types = {
+        "int8": pl.Int8,
+        "int16": pl.Int16,
+        "int32": pl.Int32,
+        "int64": pl.Int64,
+        "string": pl.Utf8,
+        "date": pl.Date,
+    }
+
+    def polars_type(dtype):
+        if isinstance(dtype, tuple):
+            _, precision, scale = dtype
+            return pl.Decimal(precision, scale)
+        return polars_types[dtype]
+
+    columns = COLUMN_DEFINITIONS[table_name]
+    pl.read_csv(
+        csv_file,
+        separator="|",
+        has_header=False,
+        new_columns=list(columns),
+        schema_overrides={col: polars_type(dtype) for col, dtype in columns.items()},
+    ).write_parquet(
+        parquet_file,
+        compression=compression,
+        row_group_size=row_group_size,
+    )
+
+
+def csv_to_parquet(csv_file, parquet_file, compression="zstd", row_group_size=None):
+    table_name = os.path.splitext(os.path.basename(csv_file))[0]
+    if row_group_size is None:
+        row_group_size = ROW_GROUP_SIZE.get(table_name, DEFAULT_ROW_GROUP_SIZE)
+
+    # Opt-in fast path: polars' SIMD CSV parser is usually faster than Arrow's
+    # on wide mixed-type files. It always writes a single file (no hive
+    # partitioning), so it stays behind an env flag.
+    if os.environ.get("SPICEAI_FAST_IO") == "polars":
+        _csv_to_parquet_polars(csv_file, parquet_file, table_name, compression, row_group_size)
+        return
+
+    # Stream the CSV batch by batch into the Parquet writer so peak memory
+    # stays proportional to one block instead of the whole table (lineitem
+    # at SF100 is ~75GB of CSV).
+    reader = csv.open_csv(
+        csv_file,
+        read_options=csv.ReadOptions(
+            column_names=list(COLUMN_DEFINITIONS[table_name]),
+            use_threads=True,
+            block_size=BLOCK_SIZE,
+        ),
+        parse_options=csv.ParseOptions(delimiter="|"),
+        convert_options=_CONVERT_OPTS[table_name],
+    )
+
+    if table_name in PARTITION_DATE_COLUMNS:
+        _write_partitioned(reader, table_name, parquet_file, compression, row_group_size)
+        return
+
+    # Write through Arrow's native file handle rather than a Python file
+    # object; row groups stream out without intermediate flushes.
+    with pa.OSFile(parquet_file, "wb") as sink, pq.ParquetWriter(
+        sink,
+        _ARROW_SCHEMAS[table_name],
+        compression=compression,
+        compression_level=3 if compression == "zstd" else None,
+        use_dictionary=LOW_CARDINALITY_COLUMNS.get(table_name, False),
+        write_statistics=True,
+    ) as writer:
+        for batch in reader:
+            writer.write_batch(batch, row_group_size=row_group_size)
+
+
+def _write_partitioned(reader, table_name, base_dir, compression, row_group_size):
+    date_column = PARTITION_DATE_COLUMNS[table_name]
+    schema = _ARROW_SCHEMAS[table_name].append(pa.field("ship_year", pa.int16()))
+
+    def batches_with_year():
+        for batch in reader:
+            year = pc.year(batch.column(date_column)).cast(pa.int16())
+            yield batch.append_column("ship_year", year)
+
+    parquet_format = ds.ParquetFileFormat()
+    ds.write_dataset(
+        pa.RecordBatchReader.from_batches(schema, batches_with_year()),
+        base_dir,
+        format=parquet_format,
+        file_options=parquet_format.make_write_options(
+            compression=compression,
+            compression_level=3 if compression == "zstd" else None,
+            use_dictionary=LOW_CARDINALITY_COLUMNS.get(table_name, False),
+            write_statistics=True,
+        ),
+        partitioning=ds.partitioning(pa.schema([("ship_year", pa.int16())]), flavor="hive"),
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_group=row_group_size,
+    )
+
+
+def _limit_arrow_threads(n_workers):
+    # Split Arrow's internal thread pool across the workers so parallel
+    # conversions don't oversubscribe the machine.
+    pa.set_cpu_count(max(1, (os.cpu_count() or 1) // n_workers))
+
+
+def _convert_table(table, compression="zstd", row_group_size=None):
+    csv_to_parquet(f"{table}.csv", f"{table}.parquet", compression, row_group_size)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert TPC-H tables from CSV to Parquet")
+    parser.add_argument("tables", nargs="+", help="table names, each expecting <table>.csv")
+    parser.add_argument("--compression", default="zstd", choices=["zstd", "snappy", "gzip"])
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=None,
+        help="rows per Parquet row group (default: per-table tuning)",
+    )
+    args = parser.parse_args()
+
+    convert = functools.partial(
+        _convert_table, compression=args.compression, row_group_size=args.row_group_size
+    )
+    if len(args.tables) == 1:
+        convert(args.tables[0])
+    else:
+        n_workers = min(len(args.tables), os.cpu_count() or 1)
+        with futures.ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_limit_arrow_threads,
+            initargs=(n_workers,),
+        ) as pool:
+            for _ in pool.map(convert, args.tables):
+                pass